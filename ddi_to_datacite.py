@@ -14,9 +14,26 @@ XML_LANG = f"{{{XML_NS}}}lang"
 
 MANDATORY_FIELDS = ["identifier", "creators", "titles", "publisher", "publicationYear"]
 
+# Variable-level section; in a codebook it follows docDscr, stdyDscr and fileDscr
+DATA_DSCR_TAG = f"{{{DDI_NS['ddi']}}}dataDscr"
+
+# Parse the OAI header and study-level sections only, stopping at <dataDscr>
+def parse_study_level(ddi_xml_path):
+    with open(ddi_xml_path, "rb") as f:
+        context = ET.iterparse(f, events=("start",), tag=DATA_DSCR_TAG)
+        for _, data_dscr in context:
+            root = data_dscr.getroottree().getroot()
+            # The parser reads ahead in chunks, so drop whatever was already
+            # built from dataDscr onwards to keep the result size-independent
+            parent = data_dscr.getparent()
+            for sibling in list(data_dscr.itersiblings()):
+                parent.remove(sibling)
+            parent.remove(data_dscr)
+            return root
+        return context.root
+
 def ddi25_to_datacite(ddi_xml_path, output_path):
-    tree = ET.parse(ddi_xml_path)
-    root = tree.getroot()
+    root = parse_study_level(ddi_xml_path)
 
     # Extract DDI fields
     identifiers = root.findall(".//ddi:IDNo", namespaces=DDI_NS)